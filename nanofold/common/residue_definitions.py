@@ -26,16 +26,16 @@ RESIDUE_INDEX = {r[0]: i for i, r in enumerate(RESIDUE_LIST)} | {
 }
 MSA_GAP = "-"
 RESIDUE_INDEX_MSA = RESIDUE_INDEX | {MSA_GAP: len(RESIDUE_INDEX)}
+RESIDUE_NAME_LOOKUP = {r[1]: r[0] for r in RESIDUE_LIST}
+RESIDUE_CODE_LOOKUP = dict(RESIDUE_LIST)
 
 
 def get_1l_res_code(resname):
-    lookup = {r[1]: r[0] for r in RESIDUE_LIST}
-    return lookup.get(resname, UNKNOWN_RESIDUE[0])
+    return RESIDUE_NAME_LOOKUP.get(resname, UNKNOWN_RESIDUE[0])
 
 
 def get_3l_res_name(res_code):
-    lookup = dict(RESIDUE_LIST)
-    return lookup.get(res_code, UNKNOWN_RESIDUE[1])
+    return RESIDUE_CODE_LOOKUP.get(res_code, UNKNOWN_RESIDUE[1])
 
 
 BACKBONE_ATOMS = ["N", "CA", "C"]
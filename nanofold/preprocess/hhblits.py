@@ -1,5 +1,6 @@
 import gzip
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -50,12 +51,11 @@ class HHblitsRunner:
             return zip_result
 
         if output.exists() and os.path.getsize(output) > 0:
-            with open(output) as f:
-                content = f.read()
+            with open(output, "rb") as f:
                 with gzip.open(zip_output, "wb") as gz_f:
-                    gz_f.write(content.encode())
+                    shutil.copyfileobj(f, gz_f)
             os.remove(output)
-            return lambda: content
+            return zip_result
         return None
 
     def run(self, a2m_file, id):
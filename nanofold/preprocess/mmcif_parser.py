@@ -41,18 +41,18 @@ def parse_chain(chain, label_chain):
     positions = []
     label_positions = []
     res_codes = []
-    coords = np.empty((0, 3, 3))
+    coords = []
     for residue, label_residue in zip(chain, label_chain):
         _, position, insert_code = residue.get_id()
         if insert_code != " ":
             raise ValueError(f"Insert codes are not supported: {insert_code}")
         if any(a not in residue for a in BACKBONE_ATOMS):
             continue
-        residue_coords = np.stack([residue[a].get_coord() for a in BACKBONE_ATOMS])
-        coords = np.concatenate([coords, residue_coords[np.newaxis, :]])
+        coords.append([residue[a].get_coord() for a in BACKBONE_ATOMS])
         positions.append(position)
         res_codes.append(get_1l_res_code(residue.get_resname()))
         label_positions.append(label_residue.get_id()[1])
+    coords = np.array(coords, dtype=np.float32) if coords else np.empty((0, 3, 3))
     rotations, translations = compute_residue_frames(coords)
     return {
         "structure_id": structure_id,
@@ -40,7 +40,7 @@ def to_chains_document(chains):
 
 def process_batch(db_manager, batch, executor):
     parser = partial(parse_mmcif_file, capture_errors=True)
-    result = [c for chains in executor.map(parser, batch) for c in chains]
+    result = [c for chains in executor.map(parser, batch, chunksize=8) for c in chains]
     db_manager.chains().insert_many(to_chains_document(result))
     db_manager.processed_mmcif_files().insert_many([{"_id": get_model_id(f)} for f in batch])
 
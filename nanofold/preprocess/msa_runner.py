@@ -1,7 +1,9 @@
 import gzip
 import logging
 import os
+import shutil
 import subprocess
+from collections import deque
 from pathlib import Path
 
 from nanofold.preprocess.sto_parser import truncate_sto
@@ -51,21 +53,20 @@ class MSARunner:
             return zip_result
 
         if output.exists() and os.path.getsize(output) > 0:
-            with open(output) as f:
-                content = f.read()
+            with open(output, "rb") as f:
                 with gzip.open(zip_output, "wb") as gz_f:
-                    gz_f.write(content.encode())
+                    shutil.copyfileobj(f, gz_f)
             os.remove(output)
-            return lambda: content
+            return zip_result
         return None
 
     def truncate_sto(self, output):
-        if self.max_sequences is not None:
-            with open(output, mode="r+") as f:
-                contents = truncate_sto(f, self.max_sequences)
-                f.seek(0)
-                f.write(contents)
-                f.truncate()
+        if self.max_sequences is None:
+            return
+        truncated_output = Path(f"{output}.truncated")
+        with open(output) as f, open(truncated_output, "w") as truncated_f:
+            truncated_f.writelines(truncate_sto(f, self.max_sequences))
+        os.replace(truncated_output, output)
 
     def run(self, fasta_input, id):
         output = self.cache_dir / f"{id}.sto"
@@ -75,11 +76,14 @@ class MSARunner:
         if cached_result is not None:
             return cached_result
         cmd = self.build_jackhmmer_cmd(fasta_input, tmp_output)
-        try:
-            subprocess.run(cmd, capture_output=True, check=True)
-        except subprocess.CalledProcessError as e:
-            logging.error(e.stderr.decode("utf-8"))
-            raise e
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        stderr_tail = deque(process.stderr, maxlen=20)
+        if process.wait() != 0:
+            stderr = "".join(stderr_tail)
+            logging.error(stderr)
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
 
         self.truncate_sto(tmp_output)
         os.rename(tmp_output, output)
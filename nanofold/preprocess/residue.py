@@ -8,8 +8,8 @@ def compute_residue_frames(coords):
     v0 = x2 - x1
     v1 = x0 - x1
     e0 = v0 / np.linalg.norm(v0, axis=-1, keepdims=True)
-    dot = e0[..., np.newaxis, :] @ v1[..., np.newaxis]
-    u1 = v1 - e0 * np.squeeze(dot, axis=-1)
+    dot = np.sum(e0 * v1, axis=-1, keepdims=True)
+    u1 = v1 - e0 * dot
 
     e1 = u1 / np.linalg.norm(u1, axis=-1, keepdims=True)
     e2 = np.cross(e0, e1)
@@ -46,8 +46,8 @@ def extract_alignments(input):
     for line in input:
         if is_alignment_line(line):
             line = line.split()
-            alignments[line[0]] = alignments.get(line[0], "") + line[1]
-    alignments = list(alignments.values())
+            alignments.setdefault(line[0], []).append(line[1])
+    alignments = ["".join(a) for a in alignments.values()]
     if not all([len(a) == len(alignments[0]) for a in alignments]):
         raise ValueError("MSA sequences are not of equal length")
     deletion_matrix = compute_deletion_matrix(alignments)
@@ -56,17 +56,19 @@ def extract_alignments(input):
 
 def filter_sto_by_sequences(input, sequences):
     input.seek(0)
-    keep_line = lambda line: any(
-        [
-            line.isspace(),
-            line.strip() == "//",
-            line.startswith("# STOCKHOLM"),
-            line.startswith("#=GC RF"),
-            line.startswith("#=GS") and line.split()[1] in sequences,
-            not (line.startswith("#") or line.isspace()) and line.split()[0] in sequences,
-        ]
-    )
-    return "".join([line for line in input if keep_line(line)])
+
+    def keep_line(line):
+        if line.isspace() or line.strip() == "//":
+            return True
+        if line.startswith("# STOCKHOLM") or line.startswith("#=GC RF"):
+            return True
+        if line.startswith("#=GS"):
+            return line.split()[1] in sequences
+        if line.startswith("#"):
+            return False
+        return line.split()[0] in sequences
+
+    return (line for line in input if keep_line(line))
 
 
 def truncate_sto(input, max_sequences):
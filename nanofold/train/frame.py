@@ -33,8 +33,10 @@ class Frame:
     @staticmethod
     def inverse(frame):
         inverse_rotations = frame.rotations.transpose(-2, -1)
-        inverse_translations = -inverse_rotations @ frame.translations.unsqueeze(-1)
-        return Frame(inverse_rotations, inverse_translations.squeeze(-1))
+        inverse_translations = -torch.einsum(
+            "...ij,...j->...i", inverse_rotations, frame.translations
+        )
+        return Frame(inverse_rotations, inverse_translations)
 
     @staticmethod
     def compose(a, b):
@@ -44,5 +46,4 @@ class Frame:
 
     @staticmethod
     def apply(frames, vectors):
-        result = frames.rotations @ vectors.unsqueeze(-1) + frames.translations.unsqueeze(-1)
-        return result.squeeze(-1)
+        return torch.einsum("...ij,...j->...i", frames.rotations, vectors) + frames.translations
@@ -5,6 +5,14 @@ import torch.nn.functional as F
 from nanofold.train.util import rigid_align
 
 
+def pairwise_distance(x):
+    x = x.float()
+    squared_norm = x.pow(2).sum(dim=-1)
+    cross = x @ x.transpose(-2, -1)
+    squared_distance = squared_norm.unsqueeze(-1) + squared_norm.unsqueeze(-2) - 2 * cross
+    return squared_distance.clamp(min=0).sqrt()
+
+
 def compute_diffusion_loss(x, x_gt, t, data_std_dev):
     with torch.no_grad():
         x_gt_aligned = rigid_align(x_gt, x).detach()
@@ -19,8 +27,8 @@ def compute_diffusion_loss(x, x_gt, t, data_std_dev):
 
 
 def compute_lddt_loss(x, x_gt):
-    dist = torch.linalg.vector_norm(x.unsqueeze(-3) - x.unsqueeze(-2), dim=-1)
-    dist_gt = torch.linalg.vector_norm(x_gt.unsqueeze(-3) - x_gt.unsqueeze(-2), dim=-1)
+    dist = pairwise_distance(x)
+    dist_gt = pairwise_distance(x_gt)
     diff = torch.abs(dist - dist_gt)
     e = 0.25 * (
         (diff < 0.5).type(diff.dtype)
@@ -44,7 +52,7 @@ class DistogramLoss(nn.Module):
 
     def forward(self, pair_rep, coords_truth):
         logits = self.projection(pair_rep + pair_rep.transpose(-3, -2))
-        distance_mat = torch.norm(coords_truth.unsqueeze(-2) - coords_truth.unsqueeze(-3), dim=-1)
+        distance_mat = pairwise_distance(coords_truth)
         index = torch.argmin(torch.abs(distance_mat.unsqueeze(-1) - self.bins), dim=-1)
         loss = nn.functional.cross_entropy(logits.transpose(-1, 1), index)
         return loss
@@ -67,7 +67,7 @@ class AtomAttentionEncoder(nn.Module):
         distance = ref_pos.unsqueeze(-2) - ref_pos.unsqueeze(-3)
         mask = (ref_space_uid.unsqueeze(-1) == ref_space_uid.unsqueeze(-2)).unsqueeze(-1)
         pair_rep = self.linear_pos_offset(distance) * mask
-        squared_distance = (distance.unsqueeze(-2) @ distance.unsqueeze(-1)).squeeze(-1)
+        squared_distance = distance.pow(2).sum(dim=-1, keepdim=True)
         pair_rep = pair_rep + self.linear_inv_sq_dist(1 / (1 + squared_distance)) * mask
         pair_rep = pair_rep + self.linear_mask(mask.float()) * mask
 
@@ -21,20 +21,28 @@ class AtomTransformer(nn.Module):
         self.diffusion_transformer = DiffusionTransformer(
             q_embedding_size, c_embedding_size, p_embedding_size, num_block, num_head
         )
+        self._beta_cache = {}
+
+    def compute_beta(self, num_queries, num_rows, num_cols, device):
+        key = (num_queries, num_rows, num_cols, device)
+        if key not in self._beta_cache:
+            centres = torch.arange(
+                (self.num_queries - 1) / 2, num_queries, self.num_queries, device=device
+            )
+            row_mask = (
+                torch.abs(torch.arange(num_rows, device=device).unsqueeze(-1) - centres)
+                < self.num_queries / 2
+            )
+            col_mask = (
+                torch.abs(torch.arange(num_cols, device=device).unsqueeze(-1) - centres)
+                < self.num_keys / 2
+            )
+            mask = torch.any(row_mask.unsqueeze(-2) & col_mask.unsqueeze(-3), dim=-1)
+            self._beta_cache[key] = -(10**10) * ~mask
+        return self._beta_cache[key]
 
     def forward(self, q, c, pair_rep):
-        device = pair_rep.device
-        centres = torch.arange(
-            (self.num_queries - 1) / 2, q.size(-2), self.num_queries, device=device
-        )
-        row_mask = (
-            torch.abs(torch.arange(pair_rep.size(-3), device=device).unsqueeze(-1) - centres)
-            < self.num_queries / 2
-        )
-        col_mask = (
-            torch.abs(torch.arange(pair_rep.size(-2), device=device).unsqueeze(-1) - centres)
-            < self.num_keys / 2
+        beta = self.compute_beta(
+            q.size(-2), pair_rep.size(-3), pair_rep.size(-2), pair_rep.device
         )
-        mask = torch.any(row_mask.unsqueeze(-2) & col_mask.unsqueeze(-3), dim=-1)
-        beta = -(10**10) * ~mask
         return self.diffusion_transformer(q, c, pair_rep, beta)
@@ -1,3 +1,4 @@
+import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
@@ -12,9 +13,8 @@ class AttentionPairBias(nn.Module):
         self.num_head = num_head
         self.ada_ln = AdaLN(a_embedding_size, s_embedding_size)
         self.layer_norm_a = nn.LayerNorm(a_embedding_size)
-        self.query = LinearWithView(a_embedding_size, (num_head, self.embedding_size))
-        self.key = LinearWithView(a_embedding_size, (num_head, self.embedding_size), bias=False)
-        self.value = LinearWithView(a_embedding_size, (num_head, self.embedding_size), bias=False)
+        self.qkv = LinearWithView(a_embedding_size, (3, num_head, self.embedding_size), bias=False)
+        self.query_bias = nn.Parameter(torch.zeros(num_head, self.embedding_size))
         self.bias = nn.Sequential(
             nn.LayerNorm(pair_embedding_size), nn.Linear(pair_embedding_size, num_head, bias=False)
         )
@@ -38,9 +38,8 @@ class AttentionPairBias(nn.Module):
         else:
             a = self.ada_ln(a, s)
 
-        q = self.query(a)
-        k = self.key(a)
-        v = self.value(a)
+        q, k, v = self.qkv(a).unbind(dim=-3)
+        q = q + self.query_bias
         b = self.bias(pair_rep) + beta.unsqueeze(-1) if beta is not None else self.bias(pair_rep)
         g = self.gate(a)
 
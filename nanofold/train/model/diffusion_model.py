@@ -103,10 +103,10 @@ class DiffusionModel(nn.Module):
 
     def centre_random_augmentation(self, x):
         batch_dims = x.shape[:-2]
-        x = x - x.mean(dim=-2, keepdim=True)
+        x = x.sub_(x.mean(dim=-2, keepdim=True))
         rotation = uniform_random_rotation(*batch_dims).to(x.device)
         translation = self.normal.sample(batch_dims).to(x.device)
-        x = (rotation.unsqueeze(-3) @ x.unsqueeze(-1)).squeeze(-1) + translation.unsqueeze(-2)
+        x = torch.einsum("...ij,...lj->...li", rotation, x).add_(translation.unsqueeze(-2))
         return x
 
     def diffusion(self, x_noisy, t, features, input, trunk, pair_rep):
@@ -136,16 +136,12 @@ class DiffusionModel(nn.Module):
             x = self.centre_random_augmentation(x)
             gamma = self.gamma_0 if c > self.gamma_min else 0
             t = c_prev * (gamma + 1)
-            noise = (
-                self.noise_scale
-                * ((t**2 - c_prev**2) ** 0.5)
-                * self.normal.sample(x.shape[:-1]).to(x.device)
-            )
-            x_noisy = x + noise
+            noise = self.normal.sample(x.shape[:-1]).to(x.device)
+            x_noisy = noise.mul_(self.noise_scale * (t**2 - c_prev**2) ** 0.5).add_(x)
             x_denoised = self.diffusion(x_noisy, t, features, input, trunk, pair_rep)
-            delta = (x - x_denoised) / t
+            delta = (x - x_denoised).div_(t)
             dt = c - t
-            x = x_noisy + self.step_scale * delta * dt
+            x = x_noisy.add_(delta.mul_(self.step_scale * dt))
 
         return x
 
@@ -28,7 +28,10 @@ class MSAPairWeightedAveraging(nn.Module):
         v = self.value(msa_rep)
         b = self.bias(pair_rep)
         g = self.gate(msa_rep)
+        # The weights come from the pair bias alone and are shared across MSA rows,
+        # so this cannot be routed through F.scaled_dot_product_attention without
+        # recomputing the softmax once per row.
         w = F.softmax(b, dim=-2)
-        o = torch.einsum("...sihc,...ijh,...sjhc->...sihc", g, w, v)
+        o = g * torch.einsum("...ijh,...sjhc->...sihc", w, v)
         msa_rep = self.proj(o.flatten(start_dim=-2))
         return msa_rep
@@ -105,12 +105,12 @@ class MSAModule(nn.Module):
         )
 
     def forward(self, features, pair_rep, input):
-        msa = features["msa"]
-        has_deletion = features["has_deletion"]
-        deletion_value = features["deletion_value"]
+        index = torch.randperm(features["msa"].size(-3))[: self.num_msa_samples]
+        msa = features["msa"][index]
+        has_deletion = features["has_deletion"][index]
+        deletion_value = features["deletion_value"][index]
         msa = torch.concat([msa, has_deletion, deletion_value], dim=-1)
-        index = torch.randperm(msa.size(-3))[: self.num_msa_samples]
-        msa_rep = self.linear_msa(msa[index].to(input.device))
+        msa_rep = self.linear_msa(msa.to(input.device))
         msa_rep = msa_rep + self.linear_input(input)
 
         for block in self.blocks:
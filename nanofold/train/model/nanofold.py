@@ -53,6 +53,8 @@ class Nanofold(nn.Module):
 
         self.use_grad_checkpoint = use_grad_checkpoint
         self.num_recycle = num_recycle
+        self._single_rep_prev = None
+        self._pair_rep_prev = None
         self.nanofold_input = torch.compile(
             NanofoldInput(
                 single_embedding_size,
@@ -179,26 +181,50 @@ class Nanofold(nn.Module):
     def get_total_loss(self, diffusion_loss, dist_loss):
         return 4 * diffusion_loss + 0.03 * dist_loss
 
+    def get_recycle_buffers(self, single_rep_init, pair_rep_init):
+        reusable = (
+            self._single_rep_prev is not None
+            and self._single_rep_prev.shape == single_rep_init.shape
+            and self._single_rep_prev.dtype == single_rep_init.dtype
+            and self._single_rep_prev.device == single_rep_init.device
+        )
+        if reusable:
+            self._single_rep_prev.zero_()
+            self._pair_rep_prev.zero_()
+        else:
+            self._single_rep_prev = torch.zeros_like(single_rep_init)
+            self._pair_rep_prev = torch.zeros_like(pair_rep_init)
+        return self._single_rep_prev, self._pair_rep_prev
+
     def forward(self, features):
         num_recycle = (
             torch.randint(self.num_recycle, (1,)) + 1 if self.training else self.num_recycle
         )
 
         input, single_rep_init, pair_rep_init = self.checkpoint(self.nanofold_input, features)
-        single_rep_prev = torch.zeros_like(single_rep_init)
-        pair_rep_prev = torch.zeros_like(pair_rep_init)
+        single_rep_prev, pair_rep_prev = self.get_recycle_buffers(single_rep_init, pair_rep_init)
 
-        for _ in range(num_recycle):
-            single_rep, pair_rep = self.checkpoint(
-                self.nanofold_trunk,
-                features,
-                input,
-                pair_rep_init,
-                single_rep_init,
-                pair_rep_prev,
-                single_rep_prev,
-            )
-            single_rep_prev, pair_rep_prev = single_rep, pair_rep
+        with torch.no_grad():
+            for _ in range(num_recycle - 1):
+                single_rep, pair_rep = self.nanofold_trunk(
+                    features,
+                    input,
+                    pair_rep_init,
+                    single_rep_init,
+                    pair_rep_prev,
+                    single_rep_prev,
+                )
+                single_rep_prev.copy_(single_rep)
+                pair_rep_prev.copy_(pair_rep)
+        single_rep, pair_rep = self.checkpoint(
+            self.nanofold_trunk,
+            features,
+            input,
+            pair_rep_init,
+            single_rep_init,
+            pair_rep_prev,
+            single_rep_prev,
+        )
 
         diffusion_losses = self.checkpoint(
             self.diffusion_model, features, input, single_rep, pair_rep
@@ -10,8 +10,7 @@ class LinearWithView(nn.Module):
         self.out_features = out_features
 
     def forward(self, x):
-        out = self.linear(x)
-        return out.view(*out.shape[:-1], *self.out_features)
+        return self.linear(x).unflatten(-1, self.out_features)
 
 
 class DropoutByDimension(nn.Module):
@@ -24,6 +24,7 @@ class Trainer:
         [l.log_model_summary(self.model) for l in self.loggers]
 
     def setup_model(self, checkpoint):
+        torch.set_float32_matmul_precision("high")
         self.model = Nanofold(**Nanofold.get_args(self.params))
         self.model = self.model.to(self.params["device"])
 